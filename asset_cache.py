@@ -0,0 +1,36 @@
+import hashlib
+import json
+import os
+import threading
+
+# One cache file shared by all image scripts: output path -> [input sha256, params]
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache.json')
+
+_lock = threading.Lock()
+
+def _load():
+    try:
+        with open(CACHE_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def cache_key(input_path, params):
+    # Key an output by the input's content hash plus the settings that produce it
+    with open(input_path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return [digest, repr(params)]
+
+def is_cached(output_path, key):
+    # True if output_path exists and was last built from the same input and params
+    if not os.path.exists(output_path):
+        return False
+    with _lock:
+        return _load().get(output_path) == key
+
+def update_cache(output_path, key):
+    with _lock:
+        cache = _load()
+        cache[output_path] = key
+        with open(CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
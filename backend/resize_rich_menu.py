@@ -1,5 +1,6 @@
 from PIL import Image
-import os
+import io
+from pathlib import Path
 
 # Input and output paths
 input_path = r"C:\Users\Admin\.gemini\antigravity\brain\235b8686-ef24-4c79-86b6-124d5a40621e\rich_menu_luxury_1768039412115.png"
@@ -11,15 +12,18 @@ target_height = 843
 
 # Open and resize
 img = Image.open(input_path)
-img_resized = img.resize((target_width, target_height), Image.LANCZOS)
-
-# Convert to RGB (JPEG doesn't support alpha)
-if img_resized.mode in ('RGBA', 'P'):
-    img_resized = img_resized.convert('RGB')
+# Let JPEG sources decode at reduced scale (no-op for PNG)
+img.draft("RGB", (target_width * 2, target_height * 2))
+# Convert to RGB before resizing so Lanczos runs on 3 channels, not 4
+img = img.convert("RGB")
+img_resized = img.resize((target_width, target_height), Image.LANCZOS, reducing_gap=2.0)
 
 # Save as JPEG with compression (LINE max is 1MB)
-img_resized.save(output_path, "JPEG", quality=85, optimize=True)
+buf = io.BytesIO()
+img_resized.save(buf, "JPEG", quality=85, optimize=False, subsampling=2)
+data = buf.getvalue()
+Path(output_path).write_bytes(data)
 print(f"✅ Resized and compressed image saved to: {output_path}")
 print(f"📐 Size: {target_width}x{target_height}")
-print(f"📦 File size: {os.path.getsize(output_path) / 1024:.1f} KB")
+print(f"📦 File size: {len(data) / 1024:.1f} KB")
 print(f"📐 New size: {target_width}x{target_height}")
@@ -0,0 +1,70 @@
+import argparse
+import os
+import runpy
+import sys
+
+# Import Pillow once up front; every script run below reuses the loaded module
+from PIL import Image  # noqa: F401
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Subcommand -> script
+COMMANDS = {
+    'resize-rich-menu': 'resize_rich_menu.py',
+    'resize-compact': 'resize_compact.py',
+    'update-login': 'update_login.py',
+    'update-home-menu': 'update_home_menu.py',
+    'crop-headers': 'crop_headers.py',
+    'update-headers': 'update_headers.py',
+    'save-summary': 'save_summary.py',
+    'fix-summary-crop': 'fix_summary_crop.py',
+    'hero-headers': 'crop_utils.py',
+    'remove-bg': 'remove_bg.py',
+}
+
+# Steps that produce the current assets, with the outputs each one owns (empty = all of
+# its outputs). Every output has exactly one producer, so repeat runs stay cached.
+ALL = [
+    ('resize-compact', ['rich_menu_home_sized.jpg']),  # login menu comes from update-login
+    ('update-login', []),
+    ('crop-headers', ['expense_header.png', 'income_header.png']),  # summary from fix-summary-crop
+    ('fix-summary-crop', []),
+    ('remove-bg', []),
+]
+
+def run(command, outputs=()):
+    # Run one script in this process, passing the outputs to build as its argv;
+    # returns False if it failed
+    print(f'== {command}')
+    script = os.path.join(SCRIPT_DIR, COMMANDS[command])
+    saved_argv = sys.argv
+    sys.argv = [script, *outputs]
+    try:
+        runpy.run_path(script, run_name='__main__')
+    except SystemExit as e:
+        # Scripts exit early when their output is up to date; only fail on a real error
+        if e.code not in (None, 0):
+            print(f'{command} failed: exit code {e.code}')
+            return False
+    except Exception as e:
+        print(f'{command} failed: {e!r}')
+        return False
+    finally:
+        sys.argv = saved_argv
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description='Build image assets in a single Python process')
+    parser.add_argument('commands', nargs='+', choices=[*COMMANDS, 'all'])
+    args = parser.parse_args()
+
+    # Keep going past a failed step so one missing source doesn't block the rest
+    ok = True
+    for command in args.commands:
+        for step, outputs in (ALL if command == 'all' else [(command, [])]):
+            ok = run(step, outputs) and ok
+
+    sys.exit(0 if ok else 1)
+
+if __name__ == '__main__':
+    main()
@@ -1,55 +1,76 @@
 from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+import io
 import os
+import sys
+from pathlib import Path
+from asset_cache import cache_key, is_cached, update_cache
 
 # Source and destination paths
 brain_dir = r'C:/Users/Admin/.gemini/antigravity/brain/a3a435fd-53e4-457f-90b1-f37df4662d93'
 output_dir = r'c:/Users/Admin/.gemini/antigravity/scratch/expense-tracker/backend/public/images'
 
-# Use the Thai culture final image
-input_path = os.path.join(brain_dir, 'summary_final_1768130588694.png')
-output_path = os.path.join(output_dir, 'summary_header.png')
-
-img = Image.open(input_path)
-print(f'Original: {img.size}')
-
-# Get dimensions
-w, h = img.size
-
 # Crop tighter - remove more of the outer edges
 # Target: 20:10 (2:1) aspect ratio for hero image
 target_ratio = 20 / 10  # 2:1
 
-# Calculate crop dimensions
-# Make it wider and shorter
-new_height = int(w / target_ratio)
-top = (h - new_height) // 2
-
-# Crop from the center
-img_cropped = img.crop((0, top, w, top + new_height))
-print(f'Cropped: {img_cropped.size}')
-
-# Convert to RGB if needed
-if img_cropped.mode in ('RGBA', 'P'):
-    img_cropped = img_cropped.convert('RGB')
-
-img_cropped.save(output_path, 'PNG', optimize=True)
-print(f'Saved: {output_path} ({os.path.getsize(output_path)/1024:.0f} KB)')
-
-# Also create expense and income headers with same crop
-expense_input = os.path.join(brain_dir, 'expense_header_v2_1768127912320.png')
-income_input = os.path.join(brain_dir, 'income_header_v2_1768127932708.png')
-
-for name, path in [('expense', expense_input), ('income', income_input)]:
-    if os.path.exists(path):
-        img = Image.open(path)
-        w, h = img.size
-        new_height = int(w / target_ratio)
-        top = (h - new_height) // 2
-        img_cropped = img.crop((0, top, w, top + new_height))
-        if img_cropped.mode in ('RGBA', 'P'):
-            img_cropped = img_cropped.convert('RGB')
-        out = os.path.join(output_dir, f'{name}_header.png')
-        img_cropped.save(out, 'PNG', optimize=True)
-        print(f'Saved: {out} ({os.path.getsize(out)/1024:.0f} KB)')
+# Use the Thai culture final image for summary,
+# and create expense and income headers with same crop
+files = [
+    ('summary_final_1768130588694.png', 'summary_header.png'),
+    ('expense_header_v2_1768127912320.png', 'expense_header.png'),
+    ('income_header_v2_1768127932708.png', 'income_header.png')
+]
+
+# Optionally build only the outputs named on the command line
+if len(sys.argv) > 1:
+    files = [f for f in files if f[1] in sys.argv[1:]]
+
+def _center_box(w, h):
+    # Calculate crop dimensions
+    # Make it wider and shorter
+    new_height = int(w / target_ratio)
+    top = (h - new_height) // 2
+    return (0, top, w, top + new_height)
+
+def _process(img, output_name, key, box):
+    out = os.path.join(output_dir, output_name)
+
+    # Crop from the center
+    img_cropped = img.crop(box)
+    print(f'{output_name}: {img.size} -> {img_cropped.size}')
+
+    # Convert to RGB if needed
+    if img_cropped.mode in ('RGBA', 'P'):
+        img_cropped = img_cropped.convert('RGB')
+
+    buf = io.BytesIO()
+    img_cropped.save(buf, 'PNG', optimize=False, compress_level=1)
+    data = buf.getvalue()
+    Path(out).write_bytes(data)
+    update_cache(out, key)
+    print(f'Saved: {out} ({len(data)/1024:.0f} KB)')
+
+# Read all input sizes first (Image.open only parses the header)
+jobs = []
+for input_name, output_name in files:
+    input_path = os.path.join(brain_dir, input_name)
+    if not os.path.exists(input_path):
+        print(f'Skipped: {input_path} not found')
+        continue
+    # Skip outputs already built from this input and ratio
+    out = os.path.join(output_dir, output_name)
+    key = cache_key(input_path, ('crop', target_ratio))
+    if is_cached(out, key):
+        print(f'Up to date: {out}')
+        continue
+    jobs.append((Image.open(input_path), output_name, key))
+
+# Inputs usually share dimensions, so compute each distinct crop box once
+crop_boxes = {size: _center_box(*size) for size in {job[0].size for job in jobs}}
+
+# Decode/crop/encode release the GIL, so files are processed in parallel
+with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+    list(ex.map(lambda job: _process(*job, crop_boxes[job[0].size]), jobs))
 
 print('Done!')
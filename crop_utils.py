@@ -0,0 +1,72 @@
+from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+import io
+import os
+from pathlib import Path
+from asset_cache import cache_key, is_cached, update_cache
+
+brain_dir = r'C:/Users/Admin/.gemini/antigravity/brain/a3a435fd-53e4-457f-90b1-f37df4662d93'
+output_dir = r'c:/Users/Admin/.gemini/antigravity/scratch/expense-tracker/backend/public/images'
+
+# Flex Message hero aspect ratio
+HERO_RATIO = 20 / 13
+
+# Header pipeline: (input, output, ratio, border trim as (top, bottom, left, right) fractions)
+headers = [
+    ('summary_clean_header_1768136487011.png', 'summary_header.png', HERO_RATIO, (0.06, 0.04, 0.02, 0.02)),
+    ('expense_header_v2_1768127912320.png', 'expense_header.png', HERO_RATIO, None),
+    ('income_header_v2_1768127932708.png', 'income_header.png', HERO_RATIO, None)
+]
+
+def trim_borders(img, top, bottom, left, right):
+    # Crop a fraction of the image off each side
+    w, h = img.size
+    return img.crop((int(w * left), int(h * top), w - int(w * right), h - int(h * bottom)))
+
+def center_crop_ratio(img, ratio):
+    # Center-crop to the given width/height ratio
+    current_ratio = img.width / img.height
+
+    if current_ratio > ratio:
+        # Too wide, crop width
+        new_width = int(img.height * ratio)
+        left = (img.width - new_width) // 2
+        return img.crop((left, 0, left + new_width, img.height))
+    else:
+        # Too tall, crop height
+        new_height = int(img.width / ratio)
+        top = (img.height - new_height) // 2
+        return img.crop((0, top, img.width, top + new_height))
+
+def process(input_name, output_name, ratio, trim=None):
+    input_path = os.path.join(brain_dir, input_name)
+    output_path = os.path.join(output_dir, output_name)
+
+    # Skip if the output was already built from this input and settings
+    key = cache_key(input_path, ('crop', ratio, trim))
+    if is_cached(output_path, key):
+        print(f'{output_name}: up to date')
+        return
+
+    img = Image.open(input_path)
+    if trim is not None:
+        img = trim_borders(img, *trim)
+    img = center_crop_ratio(img, ratio)
+
+    # Convert to RGB
+    if img.mode in ('RGBA', 'P'):
+        img = img.convert('RGB')
+
+    buf = io.BytesIO()
+    img.save(buf, 'PNG', optimize=False, compress_level=1)
+    data = buf.getvalue()
+    Path(output_path).write_bytes(data)
+    update_cache(output_path, key)
+    print(f'{output_name}: {img.size} ({len(data)/1024:.0f} KB)')
+
+if __name__ == '__main__':
+    # One process for the whole header pipeline instead of one per script
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        list(ex.map(lambda p: process(*p), headers))
+
+    print('Done!')
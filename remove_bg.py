@@ -1,24 +1,71 @@
 from PIL import Image
 import os
-import glob
+from asset_cache import cache_key, is_cached, update_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Near-white threshold: pixels brighter than this on all channels become transparent
+WHITE_THRESHOLD = 245
+
+if np is not None and njit is not None:
+    @njit(parallel=True, cache=True)
+    def _key_white(arr, thr):
+        H, W, _ = arr.shape
+        for y in prange(H):
+            for x in range(W):
+                if arr[y, x, 0] > thr and arr[y, x, 1] > thr and arr[y, x, 2] > thr:
+                    arr[y, x, 0] = 255
+                    arr[y, x, 1] = 255
+                    arr[y, x, 2] = 255
+                    arr[y, x, 3] = 0
+elif np is not None:
+    # (255, 255, 255, 0) packed as one native-endian uint32 pixel
+    _TRANSPARENT_WHITE = np.array([255, 255, 255, 0], dtype=np.uint8).view(np.uint32)[0]
+
+    def _key_white(arr, thr):
+        # All three channels exceed thr iff the smallest one does: one compare per pixel
+        white = arr[..., :3].min(axis=-1) > thr
+        # Write each keyed pixel as a single 4-byte store through a uint32 view
+        pixels = arr.view(np.uint32)[..., 0]
+        pixels[white] = _TRANSPARENT_WHITE
+
+def _key_white_bytes(buf, thr):
+    # Pure-Python fallback when NumPy isn't installed: walk the raw RGBA buffer
+    # instead of getdata()/putdata(), which build a Python tuple per pixel
+    for i in range(0, len(buf), 4):
+        if buf[i] > thr and buf[i + 1] > thr and buf[i + 2] > thr:
+            buf[i:i + 4] = b"\xff\xff\xff\x00"
 
 def make_transparent(image_path, output_path):
     print(f"Processing {image_path} -> {output_path}...")
     try:
+        # Skip if the output was already built from this input and threshold
+        key = cache_key(image_path, ("key_white", WHITE_THRESHOLD))
+        if is_cached(output_path, key):
+            print(f"Up to date: {output_path}")
+            return
+
         img = Image.open(image_path)
-        img = img.convert("RGBA")
-        datas = img.getdata()
-
-        newData = []
-        for item in datas:
-            # Check for white/near-white pixels (threshold 245+)
-            if item[0] > 245 and item[1] > 245 and item[2] > 245:
-                newData.append((255, 255, 255, 0))  # Make transparent
-            else:
-                newData.append(item)
-
-        img.putdata(newData)
-        img.save(output_path, "PNG")
+        # Make white/near-white pixels transparent (in place)
+        if np is not None:
+            arr = np.array(img.convert("RGBA"), dtype=np.uint8)
+            _key_white(arr, WHITE_THRESHOLD)
+            img = Image.fromarray(arr, "RGBA")
+        else:
+            buf = bytearray(img.convert("RGBA").tobytes())
+            _key_white_bytes(buf, WHITE_THRESHOLD)
+            img = Image.frombytes("RGBA", img.size, bytes(buf))
+
+        img.save(output_path, "PNG", optimize=False, compress_level=1)
+        update_cache(output_path, key)
         print(f"Saved {output_path}")
     except Exception as e:
         print(f"Error processing {image_path}: {e}")
@@ -44,12 +91,19 @@ icon_mapping = {
     "icon_logout_v2": "setting_logout.png",
 }
 
+# Index the source files by prefix (name without timestamp) in one directory scan.
+# Case-insensitive like glob on Windows; a missing directory just yields no matches.
+files_by_prefix = {}
+if os.path.isdir(src_dir):
+    for f in sorted(os.listdir(src_dir)):
+        if f.lower().endswith(".png"):
+            files_by_prefix.setdefault(f.rsplit("_", 1)[0].lower(), f)
+
 for prefix, output_name in icon_mapping.items():
     # Find the source file (with timestamp)
-    pattern = os.path.join(src_dir, f"{prefix}_*.png")
-    matches = glob.glob(pattern)
-    if matches:
-        src_file = matches[0]  # Get the first match
+    match = files_by_prefix.get(prefix.lower())
+    if match:
+        src_file = os.path.join(src_dir, match)
         dst_file = os.path.join(dst_dir, output_name)
         make_transparent(src_file, dst_file)
     else:
@@ -1,27 +1,58 @@
 from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
 import os
+import sys
+from pathlib import Path
+from resize_utils import RESIZE_BACKEND, VIPSTHUMBNAIL, resize, encode_jpeg, vips_resize_jpeg
+from asset_cache import cache_key, is_cached, update_cache
 
 brain_dir = r'C:/Users/Admin/.gemini/antigravity/brain/a3a435fd-53e4-457f-90b1-f37df4662d93'
 output_dir = r'c:/Users/Admin/.gemini/antigravity/scratch/expense-tracker/backend/public/images'
 
 # New compact size: 2500 x 422 (half of 843)
+size = (2500, 422)
+
 files = [
     ('rich_menu_login_1768125029832.png', 'rich_menu_login_sized.jpg'),
     ('uploaded_image_1768126653228.png', 'rich_menu_home_sized.jpg')  # User's uploaded home image
 ]
 
-for input_name, output_name in files:
+# Optionally build only the outputs named on the command line
+if len(sys.argv) > 1:
+    files = [f for f in files if f[1] in sys.argv[1:]]
+
+def _process(input_name, output_name):
     input_path = os.path.join(brain_dir, input_name)
     output_path = os.path.join(output_dir, output_name)
     
+    # Skip if the output was already built from this input and settings, either by
+    # libvips (preferred when installed) or by Pillow (also its fallback when it fails)
+    vips_key = cache_key(input_path, ('resize', size, 85, 'vips')) if VIPSTHUMBNAIL else None
+    key = cache_key(input_path, ('resize', size, 85, RESIZE_BACKEND))
+    if (vips_key and is_cached(output_path, vips_key)) or is_cached(output_path, key):
+        print(f'{output_name}: up to date')
+        return
+    
+    # Prefer libvips when installed
+    file_size = vips_resize_jpeg(input_path, output_path, size, 85)
+    if file_size is not None:
+        update_cache(output_path, vips_key)
+        print(f'{output_name}: {size} ({file_size/1024:.0f} KB) [vips]')
+        return
+    
     img = Image.open(input_path)
+    # Let JPEG sources decode at reduced scale (no-op for PNG)
+    img.draft('RGB', (size[0] * 2, size[1] * 2))
     # Resize to compact: 2500 x 422
-    img_resized = img.resize((2500, 422), Image.LANCZOS)
-    
-    if img_resized.mode in ('RGBA', 'P'):
-        img_resized = img_resized.convert('RGB')
+    img_resized = resize(img, size)
     
-    img_resized.save(output_path, 'JPEG', quality=85, optimize=True)
-    print(f'{output_name}: {img_resized.size} ({os.path.getsize(output_path)/1024:.0f} KB)')
+    data = encode_jpeg(img_resized, 85)
+    Path(output_path).write_bytes(data)
+    update_cache(output_path, key)
+    print(f'{output_name}: {img_resized.size} ({len(data)/1024:.0f} KB)')
+
+# Decode/resize/encode release the GIL, so files are processed in parallel
+with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+    list(ex.map(lambda p: _process(*p), files))
 
 print('Done! Rich Menu images resized to compact size.')
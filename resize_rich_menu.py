@@ -1,34 +1,60 @@
 from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
 import os
+from pathlib import Path
+from resize_utils import RESIZE_BACKEND, VIPSTHUMBNAIL, resize, encode_jpeg, vips_resize_jpeg
+from asset_cache import cache_key, is_cached, update_cache
 
 # Paths
 brain_dir = r'C:/Users/Admin/.gemini/antigravity/brain/a3a435fd-53e4-457f-90b1-f37df4662d93'
 output_dir = r'c:/Users/Admin/.gemini/antigravity/scratch/expense-tracker/backend/public/images'
 
+# Rich Menu target size
+size = (2500, 843)
+
 # Files to resize
 files = [
     ('rich_menu_login_1768125029832.png', 'rich_menu_login_sized.jpg'),
     ('rich_menu_home_1768125045890.png', 'rich_menu_home_sized.jpg')
 ]
 
-for input_name, output_name in files:
+def _process(input_name, output_name):
     input_path = os.path.join(brain_dir, input_name)
     output_path = os.path.join(output_dir, output_name)
+    # Save as JPEG with quality that keeps file under 1MB
+    quality = 80
+    
+    # Skip if the output was already built from this input and settings, either by
+    # libvips (preferred when installed) or by Pillow (also its fallback when it fails)
+    vips_key = cache_key(input_path, ('resize', size, quality, 'vips')) if VIPSTHUMBNAIL else None
+    key = cache_key(input_path, ('resize', size, quality, RESIZE_BACKEND))
+    if (vips_key and is_cached(output_path, vips_key)) or is_cached(output_path, key):
+        print(f'{output_name}: up to date')
+        return
+    
+    # Prefer libvips when installed
+    file_size = vips_resize_jpeg(input_path, output_path, size, quality)
+    if file_size is not None:
+        update_cache(output_path, vips_key)
+        print(f'{output_name}: {file_size/1024:.0f} KB ({size}) [vips]')
+        return
     
     # Open and resize
     img = Image.open(input_path)
-    img_resized = img.resize((2500, 843), Image.LANCZOS)
+    # Let JPEG sources decode at reduced scale (no-op for PNG)
+    img.draft('RGB', (size[0] * 2, size[1] * 2))
+    img_resized = resize(img, size)
     
-    # Convert to RGB (for JPEG)
-    if img_resized.mode in ('RGBA', 'P'):
-        img_resized = img_resized.convert('RGB')
-    
-    # Save as JPEG with quality that keeps file under 1MB
-    quality = 80
-    img_resized.save(output_path, 'JPEG', quality=quality, optimize=True)
+    data = encode_jpeg(img_resized, quality)
+    Path(output_path).write_bytes(data)
+    update_cache(output_path, key)
     
     # Check file size
-    file_size = os.path.getsize(output_path)
+    file_size = len(data)
     print(f'{output_name}: {file_size/1024:.0f} KB ({img_resized.size})')
+
+# Decode/resize/encode release the GIL, so files are processed in parallel
+with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+    list(ex.map(lambda p: _process(*p), files))
     
 print('Done!')
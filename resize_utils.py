@@ -0,0 +1,96 @@
+from PIL import Image
+import io
+import numpy as np
+import os
+import shutil
+import subprocess
+
+try:
+    import cupy as cp
+    from cupyx.scipy import ndimage as cp_ndimage
+    # CuPy can be installed without a usable CUDA device/driver; probe one up front
+    if cp.cuda.runtime.getDeviceCount() < 1:
+        cp = None
+except Exception:
+    cp = None
+
+# Which resize() implementation is active. The GPU path is a cubic-spline zoom (cupyx has
+# no Lanczos) and drops the bottom/right remainder rows/columns of its box pre-reduction,
+# so its output differs from Pillow's; scripts include this in their asset_cache keys.
+RESIZE_BACKEND = 'pillow-lanczos' if cp is None else 'cupy-spline'
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420
+    _turbojpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    # Python binding or the libturbojpeg shared library is missing
+    _turbojpeg = None
+
+# libvips CLI, if installed; streams decode/resize/encode tile by tile
+VIPSTHUMBNAIL = shutil.which('vipsthumbnail')
+
+# Resampling filter for all CPU resizes
+RESAMPLE = Image.LANCZOS
+
+def resize(img, size, reducing_gap=2.0):
+    # Resize an image to an RGB image of size (width, height), on the GPU when CuPy is available
+    # Convert first so the resize runs on 3 channels instead of round-tripping through RGBA
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+
+    if cp is None:
+        return img.resize(size, RESAMPLE, reducing_gap=reducing_gap)
+
+    w, h = size
+    arr = cp.asarray(np.asarray(img), dtype=cp.float32)
+
+    # Box-reduce each axis by its own integer factor first (like Pillow's reduce() with
+    # reducing_gap) to cut the work for large downscales; up to factor - 1 rows/columns
+    # at the bottom/right edge don't fill a whole block and are dropped
+    fy = int(arr.shape[0] / h / reducing_gap) or 1
+    fx = int(arr.shape[1] / w / reducing_gap) or 1
+    if fy > 1 or fx > 1:
+        rh = arr.shape[0] // fy * fy
+        rw = arr.shape[1] // fx * fx
+        arr = arr[:rh, :rw].reshape(rh // fy, fy, rw // fx, fx, -1).mean(axis=(1, 3))
+
+    # The spline zoom doesn't low-pass filter, so blur along any axis that still
+    # shrinks (sigma = (scale - 1) / 2, as in skimage's anti_aliasing) to avoid aliasing
+    sy = arr.shape[0] / h
+    sx = arr.shape[1] / w
+    if sy > 1 or sx > 1:
+        arr = cp_ndimage.gaussian_filter(arr, (max(0, (sy - 1) / 2), max(0, (sx - 1) / 2), 0))
+
+    # Cubic spline zoom to the exact target size
+    arr = cp_ndimage.zoom(arr, (h / arr.shape[0], w / arr.shape[1], 1), order=3)
+    arr = cp.clip(cp.rint(arr), 0, 255).astype(cp.uint8)
+    return Image.fromarray(cp.asnumpy(arr))
+
+def encode_jpeg(img, quality):
+    # Encode an RGB image to sequential 4:2:0 JPEG bytes, via libjpeg-turbo when available
+    if _turbojpeg is not None:
+        return _turbojpeg.encode(np.asarray(img), quality=quality, pixel_format=TJPF_RGB,
+                                 jpeg_subsample=TJSAMP_420)
+
+    buf = io.BytesIO()
+    # Sequential, not progressive: libjpeg forces optimize_coding on for progressive
+    # output, so progressive would bring back the Huffman-optimization pass
+    img.save(buf, 'JPEG', quality=quality, optimize=False, subsampling=2)
+    return buf.getvalue()
+
+def vips_resize_jpeg(input_path, output_path, size, quality):
+    # Resize + JPEG encode a file in one vipsthumbnail pass and return the output size
+    # in bytes, or None if libvips isn't installed or fails (caller falls back to Pillow)
+    if VIPSTHUMBNAIL is None:
+        return None
+
+    w, h = size
+    # '!' forces the exact size, matching resize()'s stretch-to-fit
+    try:
+        subprocess.run([VIPSTHUMBNAIL, input_path, '--size', f'{w}x{h}!',
+                        '-o', f'{output_path}[Q={quality},optimize_coding=false,strip]'],
+                       check=True)
+    except (subprocess.CalledProcessError, OSError) as e:
+        print(f'vipsthumbnail failed for {input_path}, falling back to Pillow: {e}')
+        return None
+    return os.path.getsize(output_path)
@@ -1,24 +1,33 @@
 from PIL import Image
-import os
+import sys
+from pathlib import Path
+from resize_utils import RESIZE_BACKEND, resize, encode_jpeg
+from asset_cache import cache_key, is_cached, update_cache
 
 # Input and output paths
 input_path = r'C:/Users/Admin/.gemini/antigravity/brain/a3a435fd-53e4-457f-90b1-f37df4662d93/uploaded_image_1768126653228.png'
 output_path = r'c:/Users/Admin/.gemini/antigravity/scratch/expense-tracker/backend/public/images/rich_menu_home_sized.jpg'
 
+# Skip if the output was already built from this input and settings
+key = cache_key(input_path, ('resize', (2500, 843), 85, RESIZE_BACKEND))
+if is_cached(output_path, key):
+    print(f'Up to date: {output_path}')
+    sys.exit(0)
+
 # Open and resize
 img = Image.open(input_path)
+# Let JPEG sources decode at reduced scale (no-op for PNG)
+img.draft('RGB', (2500 * 2, 843 * 2))
 print(f'Original size: {img.size}')
 
-img_resized = img.resize((2500, 843), Image.LANCZOS)
-
-# Convert to RGB for JPEG
-if img_resized.mode in ('RGBA', 'P'):
-    img_resized = img_resized.convert('RGB')
+img_resized = resize(img, (2500, 843))
 
 # Save
-img_resized.save(output_path, 'JPEG', quality=85, optimize=True)
+data = encode_jpeg(img_resized, 85)
+Path(output_path).write_bytes(data)
+update_cache(output_path, key)
 
-file_size = os.path.getsize(output_path) / 1024
+file_size = len(data) / 1024
 print(f'Saved: {output_path}')
 print(f'Size: {file_size:.0f} KB')
 print('Done!')
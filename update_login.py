@@ -1,5 +1,9 @@
 from PIL import Image
 import os
+import sys
+from pathlib import Path
+from resize_utils import RESIZE_BACKEND, resize, encode_jpeg
+from asset_cache import cache_key, is_cached, update_cache
 
 brain_dir = r'C:/Users/Admin/.gemini/antigravity/brain/a3a435fd-53e4-457f-90b1-f37df4662d93'
 output_dir = r'c:/Users/Admin/.gemini/antigravity/scratch/expense-tracker/backend/public/images'
@@ -7,16 +11,23 @@ output_dir = r'c:/Users/Admin/.gemini/antigravity/scratch/expense-tracker/backen
 input_path = os.path.join(brain_dir, 'uploaded_image_1768129982543.png')
 output_path = os.path.join(output_dir, 'rich_menu_login_sized.jpg')
 
+# Skip if the output was already built from this input and settings
+key = cache_key(input_path, ('resize', (2500, 422), 85, RESIZE_BACKEND))
+if is_cached(output_path, key):
+    print(f'Up to date: {output_path}')
+    sys.exit(0)
+
 img = Image.open(input_path)
+# Let JPEG sources decode at reduced scale (no-op for PNG)
+img.draft('RGB', (2500 * 2, 422 * 2))
 print(f'Original: {img.size}')
 
 # Resize to 2500 x 422
-img_resized = img.resize((2500, 422), Image.LANCZOS)
-
-if img_resized.mode in ('RGBA', 'P'):
-    img_resized = img_resized.convert('RGB')
+img_resized = resize(img, (2500, 422))
 
-img_resized.save(output_path, 'JPEG', quality=85, optimize=True)
+data = encode_jpeg(img_resized, 85)
+Path(output_path).write_bytes(data)
+update_cache(output_path, key)
 print(f'Saved: {output_path}')
-print(f'Size: {os.path.getsize(output_path)/1024:.0f} KB')
+print(f'Size: {len(data)/1024:.0f} KB')
 print('Done!')